@@ -2,3 +2,5 @@
 # - utils.py: asset_path, rects_from_level (fallback)
 # - animation.py: slice_grid, Animation, Animator
 # - tilemap.py: CSV tilemap loader / renderer
+# - physics.py: float movement helpers (next_vx, approach)
+# - spatial.py: SpatialHash broad-phase for rect lists
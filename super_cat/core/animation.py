@@ -14,18 +14,12 @@ def slice_grid(
 
     Frames are extracted row by row
     """
-    frames = []
     w, h = surface.size
-    y = margin
-    while y + fh <= h:
-        x = margin
-        while x + fw <= w:
-            rect = pygame.Rect(x, y, fw, fh)
-            frame = surface.subsurface(rect).copy()
-            frames.append(frame)
-            x += fw + spacing
-        y += fh + spacing
-    return frames
+    return [
+        surface.subsurface((x, y, fw, fh)).copy()
+        for y in range(margin, h - fh + 1, fh + spacing)
+        for x in range(margin, w - fw + 1, fw + spacing)
+    ]
 
 
 def frames_from_row(
@@ -50,6 +44,8 @@ def scale_frames(
 
 
 class Animation:
+    __slots__ = ("frames", "loop", "time", "index", "image", "_fps", "_rate", "_step")
+
     def __init__(
         self,
         frames: list[pygame.Surface],
@@ -57,31 +53,48 @@ class Animation:
         loop: bool = True,
     ):
         self.frames = frames
-        self.fps = fps
+        self.fps = fps  # also sets the cached frame rate and duration
         self.loop = loop
         self.time = 0.0
         self.index = 0
+        # Current frame surface, refreshed only when the index changes
+        self.image = frames[0] if frames else None
+
+    @property
+    def fps(self) -> int:
+        return self._fps
+
+    @fps.setter
+    def fps(self, fps: int):
+        # Frame rate and duration (s) cached on assignment: update() multiplies
+        # instead of dividing every tick
+        self._fps = fps
+        self._rate = max(1, fps)
+        self._step = 1.0 / self._rate
 
     def reset(self):
         self.time = 0.0
         self.index = 0
+        self.image = self.frames[0] if self.frames else None
 
     def update(self, dt: float):
         if not self.frames:
             return
         self.time += dt
-        step = 1.0 / max(1, self.fps)  # interval between frames in seconds.
-        # Skip frames to pick correct frame
-        while self.time >= step:
-            self.time -= step
-            self.index += 1
-            if self.loop:
-                self.index %= len(self.frames)
-            else:
-                self.index = min(self.index, len(self.frames) - 1)
+        # Between frame boundaries only the clock moves
+        if self.time < self._step:
+            return
+        # Advance all elapsed frames at once (constant time on lag spikes)
+        steps = int(self.time * self._rate)
+        self.time -= steps * self._step
+        if self.loop:
+            self.index = (self.index + steps) % len(self.frames)
+        else:
+            self.index = min(self.index + steps, len(self.frames) - 1)
+        self.image = self.frames[self.index]
 
     def current(self) -> pygame.Surface | None:
-        return self.frames[self.index] if self.frames else None
+        return self.image
 
 
 class Animator:
@@ -95,23 +108,32 @@ class Animator:
         frame = animator.frame()
     """
 
+    __slots__ = ("clips", "state", "image", "_current")
+
     def __init__(self, clips: dict[str, Animation], initial: str) -> None:
         self.clips = clips
         self.state = initial
+        # Clip for the current state, refreshed only on state changes
+        self._current = clips.get(initial)
+        # Frame to draw; read this attribute instead of calling frame()
+        self.image = self._current.image if self._current else None
 
     def set_state(self, state: str):
         if state == self.state:
             return
         self.state = state
-        clip = self.clips.get(state)
-        if clip:
-            clip.reset()
+        self._current = self.clips.get(state)
+        if self._current:
+            self._current.reset()
+            self.image = self._current.image
+        else:
+            self.image = None
 
     def update(self, dt: float):
-        clip = self.clips.get(self.state)
+        clip = self._current
         if clip:
             clip.update(dt)
+            self.image = clip.image
 
     def frame(self) -> pygame.Surface | None:
-        clip = self.clips.get(self.state)
-        return clip.current() if clip else None
+        return self.image
@@ -6,10 +6,15 @@ from settings import WIDTH, HEIGHT
 
 
 class Camera:
+    __slots__ = ("rect", "world_w", "world_h", "offset_x", "offset_y")
+
     def __init__(self, world_width, world_height):
         self.rect = pygame.FRect(0, 0, WIDTH, HEIGHT)
         self.world_w = world_width
         self.world_h = world_height
+        # Rounded integer offset, cached once per follow() for draw code
+        self.offset_x = 0
+        self.offset_y = 0
 
     @property
     def offset(self):
@@ -18,6 +23,8 @@ class Camera:
     def follow(self, target_rect: pygame.FRect):
         self.rect.center = target_rect.center
         self._clamp_to_world()
+        self.offset_x = round(self.rect.x)
+        self.offset_y = round(self.rect.y)
 
     def _clamp_to_world(self):
         """keep the camera viewport within the world bounds."""
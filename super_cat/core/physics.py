@@ -0,0 +1,74 @@
+# physics.py
+
+# Horizontal movement math on plain floats (no pygame objects), so the
+# per-frame velocity update is a single call without method dispatch.
+# Tuning constants are bound as keyword-only defaults: the hot path reads
+# them as fast locals instead of module globals. Physics runs on a fixed
+# timestep, so the per-step deltas (rate * FIXED_DT) are precomputed here.
+
+from math import copysign
+
+from settings import (
+    MAX_SPEED,
+    ACCEL_GROUND,
+    ACCEL_AIR,
+    DECEL_GROUND,
+    DECEL_AIR,
+    FRICTION_GROUND,
+    FRICTION_AIR,
+    FIXED_DT,
+)
+
+# Velocity change per fixed physics step (px/s)
+STEP_ACCEL_GROUND = ACCEL_GROUND * FIXED_DT
+STEP_ACCEL_AIR = ACCEL_AIR * FIXED_DT
+STEP_DECEL_GROUND = DECEL_GROUND * FIXED_DT
+STEP_DECEL_AIR = DECEL_AIR * FIXED_DT
+STEP_FRICTION_GROUND = FRICTION_GROUND * FIXED_DT
+STEP_FRICTION_AIR = FRICTION_AIR * FIXED_DT
+
+
+def approach(value: float, target: float, max_delta: float) -> float:
+    """Move value toward target by at most max_delta."""
+    return (
+        min(value + max_delta, target)
+        if value < target
+        else max(value - max_delta, target)
+    )
+
+
+def next_vx(
+    vx: float,
+    input_dir: int,
+    on_ground: bool,
+    surface_friction: float,
+    *,
+    _max_speed: float = MAX_SPEED,
+    _accel_ground: float = STEP_ACCEL_GROUND,
+    _accel_air: float = STEP_ACCEL_AIR,
+    _decel_ground: float = STEP_DECEL_GROUND,
+    _decel_air: float = STEP_DECEL_AIR,
+    _friction_ground: float = STEP_FRICTION_GROUND,
+    _friction_air: float = STEP_FRICTION_AIR,
+    _approach=approach,
+    _copysign=copysign,
+) -> float:
+    """Horizontal velocity after one fixed step of acceleration, braking or friction."""
+    if input_dir != 0:
+        # Apply ground/air parameters; ground values are scaled by surface friction.
+        if on_ground:
+            accel = _accel_ground * surface_friction
+            decel = _decel_ground * surface_friction
+        else:
+            accel = _accel_air
+            decel = _decel_air
+        # copysign's +-1.0 matches sign(vx) whenever |vx| > 1e-5
+        if abs(vx) > 1e-5 and _copysign(1.0, vx) != input_dir:
+            # Kill opposite momentum before accelerating toward the target speed.
+            vx = _approach(vx, 0.0, decel)
+        vx = _approach(vx, input_dir * _max_speed, accel)
+    else:
+        friction = _friction_ground * surface_friction if on_ground else _friction_air
+        vx = _approach(vx, 0.0, friction)
+    # Clamp to the top speed inline (saves a call per frame)
+    return _max_speed if vx > _max_speed else -_max_speed if vx < -_max_speed else vx
@@ -0,0 +1,42 @@
+# spatial.py
+
+# Uniform-grid spatial hash for broad-phase rect lookups
+
+import pygame
+
+from settings import TILE
+
+
+class SpatialHash:
+    """
+    Buckets static rects by grid cell so a query only touches nearby ones.
+
+    Example:
+        solids = SpatialHash(rects)
+        entity.move_and_collide(solids.query)
+    """
+
+    __slots__ = ("rects", "cell", "cells")
+
+    def __init__(self, rects: list[pygame.FRect] | list[pygame.Rect], cell: int = TILE):
+        self.rects = rects
+        self.cell = cell
+        # (cx, cy) -> indices into `rects`
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        for i, r in enumerate(rects):
+            for cy in range(int(r.top // cell), int(r.bottom // cell) + 1):
+                for cx in range(int(r.left // cell), int(r.right // cell) + 1):
+                    self.cells.setdefault((cx, cy), []).append(i)
+
+    def query(self, rect: pygame.FRect) -> list[pygame.FRect] | list[pygame.Rect]:
+        """Rects sharing a cell with `rect`, in their original list order."""
+        cell = self.cell
+        cells = self.cells
+        found: set[int] = set()
+        for cy in range(int(rect.top // cell), int(rect.bottom // cell) + 1):
+            for cx in range(int(rect.left // cell), int(rect.right // cell) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        rects = self.rects
+        return [rects[i] for i in sorted(found)]
@@ -2,58 +2,122 @@
 
 # CSV-based tilemap loader and renderer
 # - Map CSV values: -1 = empty, 0..N = tile index
-# - Tileset is a grid spritesheet sliced to frames
+# - Tileset is a grid spritesheet sliced to frames (animation.slice_grid)
 
 import csv
+from array import array
 from pathlib import Path
 
 import pygame
 
+from .animation import slice_grid
 from .camera import Camera
+from .spatial import SpatialHash
 from .tileprops import TilesetProps
 from settings import TILE
 
-Grid = list[list[int]]
+# Rows are compact int16 arrays (2 bytes per cell instead of a boxed int)
+Grid = list[array[int]]
+
+# Side length (px) of the pre-rendered map chunks
+CHUNK_PX = 512
+# Transparent color for tiles converted to colorkey blits
+COLORKEY = (255, 0, 255)
 
 
 def load_csv_grid(csv_file: Path) -> Grid:
     """Load a CSV file into a 2D grid of ints."""
-    grid: Grid = []
     with open(csv_file, newline="") as file:
-        reader = csv.reader(file)
-        for row in reader:
-            grid.append([int(x) for x in row])
-    return grid
+        return [array("h", map(int, row)) for row in csv.reader(file)]
 
 
 def build_rects_of_indices(
-    grid: Grid, indices: set[int], tile_size: int = TILE
+    grid: Grid, indices: set[int] | frozenset[int], tile_size: int = TILE
 ) -> list[pygame.Rect]:
     """Create axis-aligned solid rects from grid indices."""
-    rects: list[pygame.Rect] = []
+    return [
+        pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
+        for y, row in enumerate(grid)
+        # Rows without any match are rejected by one C-level set scan
+        if not indices.isdisjoint(row)
+        for x, idx in enumerate(row)
+        if idx in indices
+    ]
+
+
+def merge_rects_of_indices(
+    grid: Grid,
+    indices: set[int] | frozenset[int],
+    tile_w: int = TILE,
+    tile_h: int = TILE,
+    vertical: bool = True,
+) -> list[pygame.FRect]:
+    """
+    Create collision rects from grid indices, merging adjacent cells.
+
+    Horizontal runs of matching cells become a single strip. With `vertical`,
+    strips stacked directly on top of each other with the same x/width are
+    merged into one block as well.
+    """
+    rects: list[pygame.FRect] = []
+    # (start col, run length) -> rect ending on the previous row
+    prev_strips: dict[tuple[int, int], pygame.FRect] = {}
     for y, row in enumerate(grid):
-        for x, idx in enumerate(row):
-            if idx in indices:
-                rects.append(
-                    pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
-                )
+        strips: dict[tuple[int, int], pygame.FRect] = {}
+        if indices.isdisjoint(row):
+            prev_strips = strips
+            continue
+        x, w = 0, len(row)
+        while x < w:
+            if row[x] not in indices:
+                x += 1
+                continue
+            x0 = x
+            while x < w and row[x] in indices:
+                x += 1
+            key = (x0, x - x0)
+            rect = prev_strips.get(key) if vertical else None
+            if rect is not None:
+                rect.h += tile_h
+            else:
+                rect = pygame.FRect(x0 * tile_w, y * tile_h, (x - x0) * tile_w, tile_h)
+                rects.append(rect)
+            strips[key] = rect
+        prev_strips = strips
     return rects
 
 
-def slice_tileset(
-    image: pygame.Surface, tw: int, th: int, margin: int = 0, spacing: int = 0
-) -> list[pygame.Surface]:
-    frames: list[pygame.Surface] = []
-    w, h = image.size
-    y = margin
-    while y + th <= h:
-        x = margin
-        while x + tw <= w:
-            rect = pygame.Rect(x, y, tw, th)
-            frames.append(image.subsurface(rect).copy())
-            x += tw + spacing
-        y += th + spacing
-    return frames
+def optimize_tile_frame(frame: pygame.Surface) -> pygame.Surface:
+    """
+    Convert a tile frame to the cheapest blit format for its alpha.
+
+    Fully opaque frames drop per-pixel alpha; frames with only 0/255 alpha
+    use a colorkey instead. Anything semi-transparent stays SRCALPHA.
+    """
+    alphas = set(pygame.image.tobytes(frame, "RGBA")[3::4])
+    if alphas <= {255}:
+        return frame.convert()
+    if alphas <= {0, 255}:
+        # Keep alpha if an opaque pixel already uses the key color
+        opaque = pygame.mask.from_surface(frame, 254)
+        keyed = pygame.mask.from_threshold(frame, COLORKEY, (1, 1, 1, 255))
+        if not opaque.overlap_area(keyed, (0, 0)):
+            out = pygame.Surface(frame.size)
+            out.fill(COLORKEY)
+            out.blit(frame, (0, 0))
+            out = out.convert()
+            out.set_colorkey(COLORKEY)
+            return out
+    return frame
+
+
+def blits_as_colorkey(frame: pygame.Surface) -> bool:
+    """True if `frame` can be composited onto a COLORKEY-filled surface."""
+    if frame.get_flags() & pygame.SRCALPHA:
+        return False
+    visible = pygame.mask.from_surface(frame)
+    keyed = pygame.mask.from_threshold(frame, COLORKEY, (1, 1, 1, 255))
+    return not visible.overlap_area(keyed, (0, 0))
 
 
 class TileMap:
@@ -77,29 +141,59 @@ class TileMap:
         self.tile_w = tile_w
         self.tile_h = tile_h
         self.props = props or TilesetProps()
+        # Default to non-negative indices if props don't mark any tile solid
+        self.solid_indices = self.props.solid_indices or {
+            i for row in self.grid for i in row if i >= 0
+        }
         self.tileset_frames: list[pygame.Surface] | None = None
         if tileset_path and tileset_path.exists():
             image = pygame.image.load(tileset_path).convert_alpha()
-            self.tileset_frames = slice_tileset(image, tile_w, tile_h)
+            self.tileset_frames = [
+                optimize_tile_frame(f) for f in slice_grid(image, tile_w, tile_h)
+            ]
+        # Plain tile blitted for indices without a tileset frame
+        self._fallback = pygame.Surface((tile_w, tile_h)).convert()
+        self._fallback.fill((110, 110, 115))
+        # Flat index -> friction table for the per-frame friction lookup
+        self._friction = {i: p.friction for i, p in self.props.tiles.items()}
+        self._solid_rects = merge_rects_of_indices(
+            self.grid, self.solid_indices, tile_w, tile_h
+        )
+        # Broad-phase index over the merged rects, used by query_solids
+        self._solid_hash = SpatialHash(self._solid_rects, cell=tile_w)
+        one_way = self.props.one_way_indices
+        # Horizontal merge only: every row of a stacked one-way column is
+        # its own platform
+        self._one_way_rects = (
+            merge_rects_of_indices(self.grid, one_way, tile_w, tile_h, vertical=False)
+            if one_way
+            else []
+        )
+        self._build_chunks()
 
     @property
     def world_size(self):
         return self.w * self.tile_w, self.h * self.tile_h
 
-    def solid_rects(self, solid_indices: set[int] | None = None) -> list[pygame.Rect]:
-        # if solid_indices not given, derive from props.solid_indices;
-        # default to non-negative if props empty
+    def solid_rects(self, solid_indices: set[int] | None = None) -> list[pygame.FRect]:
+        """Merged solid rects; cached unless custom indices are given."""
         if solid_indices is None:
-            solid_indices = self.props.solid_indices or {
-                i for row in self.grid for i in row if i >= 0
-            }
-        return build_rects_of_indices(self.grid, solid_indices, self.tile_w)
+            return self._solid_rects
+        return merge_rects_of_indices(
+            self.grid, solid_indices, self.tile_w, self.tile_h
+        )
 
-    def one_way_rects(self) -> list[pygame.Rect]:
-        indices = self.props.one_way_indices
-        if not indices:
-            return []
-        return build_rects_of_indices(self.grid, indices, self.tile_w)
+    def query_solids(self, rect: pygame.FRect) -> list[pygame.FRect]:
+        """
+        Merged solid rects near `rect`, in solid_rects() order.
+
+        A spatial hash over the merged rects keeps this a lookup of a few
+        cells instead of a scan over every solid.
+        """
+        return self._solid_hash.query(rect)
+
+    def one_way_rects(self) -> list[pygame.FRect]:
+        return self._one_way_rects
 
     def deadly_rects(self) -> list[pygame.Rect]:
         """Rects for deadly tiles (AABB collision)."""
@@ -123,21 +217,74 @@ class TileMap:
                     pts.append((cx, cy))
         return pts
 
-    def draw(self, target: pygame.Surface, camera: Camera, empty_value: int = -1):
-        # Draw cell-by-cell. For larger maps batch/diff drawing would be better.
-        for y, row in enumerate(self.grid):
-            for x, idx in enumerate(row):
-                if idx == empty_value:
-                    continue
-                dst = pygame.Rect(
-                    x * self.tile_w, y * self.tile_h, self.tile_w, self.tile_h
+    def _build_chunks(self, chunk_px: int = CHUNK_PX, empty_value: int = -1):
+        """Pre-render the static map into chunk_px x chunk_px surfaces."""
+        self.chunk_px = chunk_px
+        self.empty_value = empty_value
+        self.chunks: dict[tuple[int, int], pygame.Surface] = {}
+        # Without per-pixel alpha in the tileset, chunks can be plain
+        # colorkey surfaces that blit without alpha blending
+        self._keyed_chunks = all(
+            blits_as_colorkey(f) for f in self.tileset_frames or []
+        )
+        world_w, world_h = self.world_size
+        for cy in range(-(-world_h // chunk_px)):
+            for cx in range(-(-world_w // chunk_px)):
+                self._render_chunk(cx, cy)
+
+    def _render_chunk(self, cx: int, cy: int):
+        cp = self.chunk_px
+        tw, th = self.tile_w, self.tile_h
+        world_w, world_h = self.world_size
+        ox, oy = cx * cp, cy * cp
+        # Edge chunks are clipped to the world size
+        size = (min(cp, world_w - ox), min(cp, world_h - oy))
+        if self._keyed_chunks:
+            chunk = pygame.Surface(size).convert()
+            chunk.fill(COLORKEY)
+        else:
+            chunk = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+
+        # Tiles straddling the chunk border are clipped by blit
+        start_col, end_col = ox // tw, min(self.w, -(-(ox + cp) // tw))
+        start_row, end_row = oy // th, min(self.h, -(-(oy + cp) // th))
+        frames = self.tileset_frames or []
+        n_frames = len(frames)
+        chunk.blits(
+            [
+                (
+                    frames[idx] if 0 <= idx < n_frames else self._fallback,
+                    (x * tw - ox, y * th - oy),
                 )
-                dst = camera.apply(dst)
-                if self.tileset_frames and 0 <= idx < len(self.tileset_frames):
-                    target.blit(self.tileset_frames[idx], dst)
-                else:
-                    # Fallback: draw a simple tile rect
-                    pygame.draw.rect(target, (110, 110, 115), dst)
+                for y in range(start_row, end_row)
+                for x, idx in enumerate(self.grid[y][start_col:end_col], start_col)
+                if idx != self.empty_value
+            ],
+            doreturn=False,
+        )
+        if self._keyed_chunks:
+            chunk.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        self.chunks[(cx, cy)] = chunk
+
+    def draw(self, target: pygame.Surface, camera: Camera):
+        # Blit only the pre-rendered chunks overlapping the camera viewport.
+        cam = camera.rect
+        cam_x = camera.offset_x
+        cam_y = camera.offset_y
+        cp = self.chunk_px
+        start_cx = max(0, int(cam.left) // cp)
+        end_cx = int(cam.right) // cp
+        start_cy = max(0, int(cam.top) // cp)
+        end_cy = int(cam.bottom) // cp
+        target.blits(
+            [
+                (chunk, (cx * cp - cam_x, cy * cp - cam_y))
+                for cy in range(start_cy, end_cy + 1)
+                for cx in range(start_cx, end_cx + 1)
+                if (chunk := self.chunks.get((cx, cy)))
+            ],
+            doreturn=False,
+        )
 
     def index_at_pixel(self, x: int, y: int) -> int:
         """Get tile index at a world pixel; returns -1 if out of bounds or empty."""
@@ -163,13 +310,12 @@ class TileMap:
         right = int(rect.right) - 1
         start_col = max(0, left // self.tile_w)
         end_col = min(self.w - 1, right // self.tile_w)
-        indices_under = [
-            idx
-            for col in range(start_col, end_col + 1)
-            if (idx := self.grid[row][col]) != empty_value
+        friction = self._friction
+        frictions = [
+            friction.get(idx, 1.0)
+            for idx in self.grid[row][start_col : end_col + 1]
+            if idx != empty_value
         ]
-
-        frictions = [self.props.get(idx).friction for idx in indices_under]
         if not frictions:
             return 1.0
         return sum(frictions) / len(frictions)
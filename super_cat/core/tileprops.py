@@ -2,11 +2,13 @@
 
 # Tileset properties: load from JSON and expose helper accessors.
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TileProps:
     # Extendable per-tile properties
     solid: bool = False
@@ -16,25 +18,26 @@ class TileProps:
     friction: float = 1.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TilesetProps:
-    tiles: dict[int, TileProps] = field(default_factory=dict)
-
-    @property
-    def solid_indices(self) -> set[int]:
-        return {idx for idx, props in self.tiles.items() if props.solid}
-
-    @property
-    def one_way_indices(self) -> set[int]:
-        return {idx for idx, props in self.tiles.items() if props.one_way}
-
-    @property
-    def deadly_indices(self) -> set[int]:
-        return {idx for idx, props in self.tiles.items() if props.deadly}
-
-    @property
-    def spawn_indices(self) -> set[int]:
-        return {idx for idx, props in self.tiles.items() if props.spawn}
+    tiles: Mapping[int, TileProps] = field(default_factory=dict)
+    # Index sets per flag, computed once from `tiles` on construction; the
+    # dataclass is frozen and `tiles` read-only so they cannot go stale
+    solid_indices: frozenset[int] = field(init=False)
+    one_way_indices: frozenset[int] = field(init=False)
+    deadly_indices: frozenset[int] = field(init=False)
+    spawn_indices: frozenset[int] = field(init=False)
+
+    def __post_init__(self):
+        # Copy, so the caller's dict can't change underneath the index sets
+        tiles = MappingProxyType(dict(self.tiles))
+        items = tiles.items()
+        set_ = object.__setattr__  # frozen dataclass
+        set_(self, "tiles", tiles)
+        set_(self, "solid_indices", frozenset(i for i, p in items if p.solid))
+        set_(self, "one_way_indices", frozenset(i for i, p in items if p.one_way))
+        set_(self, "deadly_indices", frozenset(i for i, p in items if p.deadly))
+        set_(self, "spawn_indices", frozenset(i for i, p in items if p.spawn))
 
     def get(self, idx: int) -> TileProps:
         return self.tiles.get(idx, TileProps())
@@ -1,13 +1,33 @@
 # base.py
 
+from collections.abc import Callable
+
 import pygame
 
 # from super_cat.core.camera import Camera
 from core.camera import Camera
-from settings import GRAVITY, TERMINAL_V
+from settings import FIXED_DT, GRAVITY, TERMINAL_V
+
+type Rects = list[pygame.FRect] | list[pygame.Rect]
+# Broad-phase lookup: returns the solids near the given rect
+type SolidQuery = Callable[[pygame.FRect], Rects]
+# (surface, dest) pair as accepted by Surface.blits
+type BlitItem = tuple[pygame.Surface, tuple[int, int]]
 
 
 class Entity:
+    __slots__ = (
+        "rect",
+        "vx",
+        "vy",
+        "on_ground",
+        "color",
+        "ignore_one_way_timer",
+        "prev_x",
+        "prev_y",
+        "_fill",
+    )
+
     def __init__(
         self,
         pos: tuple[float, float],
@@ -15,67 +35,106 @@ class Entity:
         color: pygame.typing.ColorLike,
     ):
         self.rect = pygame.FRect(pos, size)
-        self.vel = pygame.Vector2(0, 0)
+        # Position at the start of the current physics step, for render
+        # interpolation between fixed steps
+        self.prev_x, self.prev_y = self.rect.topleft
+        # Plain floats: cheaper to read/write every frame than Vector2 attributes
+        self.vx = 0.0
+        self.vy = 0.0
         self.on_ground = False
         self.color = color
         # Timer to ignore one-way collisions (for drop-through)
         self.ignore_one_way_timer = 0.0
+        # Placeholder surface, created on first draw (needs a display mode)
+        self._fill: pygame.Surface | None = None
 
     def move_and_collide(
         self,
-        dt: float,
-        solids: list[pygame.FRect] | list[pygame.Rect],
-        one_ways: list[pygame.FRect] | list[pygame.Rect] | None = None,
+        solids: Rects | SolidQuery,
+        one_ways: Rects | None = None,
     ):
         """
         Integrate velocity, collide against solids;
         For one-way tiles, only collide when falling and coming from above.
+
+        `solids` is either a flat list of rects or a query callable
+        (e.g. TileMap.query_solids) returning only the candidates near a rect.
+        Advances one fixed physics step (FIXED_DT).
         """
-        if one_ways is None:
-            one_ways = []
+        dt = FIXED_DT
+        # Locals avoid repeated attribute lookups in this per-frame hot path
+        rect = self.rect
+        query = solids if callable(solids) else None
 
         # --- Horizontal movement ---
-        self.rect.x += self.vel.x * dt
+        vx = self.vx
+        rect.x += vx * dt
         # collide vs full solids only (one-way doesn't block horizontally)
-        hits = [t for t in solids if self.rect.colliderect(t)]
-        for t in hits:
-            if self.vel.x > 0:
-                self.rect.right = t.left
-            elif self.vel.x < 0:
-                self.rect.left = t.right
+        if vx:
+            candidates = query(rect) if query else solids
+            for i in rect.collidelistall(candidates):
+                t = candidates[i]
+                if vx > 0:
+                    rect.right = t.left
+                else:
+                    rect.left = t.right
 
         # --- Vertical movement ---
-        prev_bottom = self.rect.bottom  # remember previous bottom for one-way check
-        self.vel.y = min(self.vel.y + GRAVITY * dt, TERMINAL_V)
-        self.rect.y += self.vel.y * dt
+        prev_bottom = rect.bottom  # remember previous bottom for one-way check
+        vy = min(self.vy + GRAVITY * dt, TERMINAL_V)
+        rect.y += vy * dt
 
-        self.on_ground = False
+        on_ground = False
 
         # 1) collide vs full solids(both up & down)
-        hits = [t for t in solids if self.rect.colliderect(t)]
-        for t in hits:
-            if self.vel.y > 0:
-                self.vel.y = 0
-                self.rect.bottom = t.top
-                self.on_ground = True
-            elif self.vel.y < 0:
-                self.vel.y = 0
-                self.rect.top = t.bottom
+        # Resolving a hit zeroes vy, so only the first hit matters
+        candidates = query(rect) if query else solids
+        i = rect.collidelist(candidates)
+        if i != -1 and vy:
+            t = candidates[i]
+            if vy > 0:
+                rect.bottom = t.top
+                on_ground = True
+            else:
+                rect.top = t.bottom
+            vy = 0.0
 
         # 2) collide vs one-way platforms
         if self.ignore_one_way_timer > 0.0:
             self.ignore_one_way_timer = max(0.0, self.ignore_one_way_timer - dt)
-        else:
-            if self.vel.y >= 0:  # only when falling / moving down or resting
-                hits = [
-                    t
-                    for t in one_ways
-                    if self.rect.colliderect(t) and prev_bottom <= t.top
-                ]
-                for t in hits:
-                    self.rect.bottom = t.top
-                    self.vel.y = 0
-                    self.on_ground = True
-
-    def draw(self, surf: pygame.Surface, camera: Camera):
-        pygame.draw.rect(surf, self.color, camera.apply(self.rect))
+        elif vy >= 0 and one_ways:  # only when falling / moving down or resting
+            for i in rect.collidelistall(one_ways):
+                t = one_ways[i]
+                if prev_bottom <= t.top:
+                    rect.bottom = t.top
+                    vy = 0.0
+                    on_ground = True
+
+        self.vy = vy
+        self.on_ground = on_ground
+
+    def save_position(self):
+        """Mark the current position as the start of the next physics step."""
+        self.prev_x, self.prev_y = self.rect.topleft
+
+    def render_pos(self, alpha: float) -> tuple[float, float]:
+        """Top-left blended between the previous (0.0) and current (1.0) step."""
+        px, py = self.prev_x, self.prev_y
+        rect = self.rect
+        return px + (rect.x - px) * alpha, py + (rect.y - py) * alpha
+
+    def blit_item(self, camera: Camera, alpha: float = 1.0) -> BlitItem:
+        """Surface and screen position for batching into Surface.blits."""
+        rect = self.rect
+        x, y = self.render_pos(alpha)
+        fill = self._fill
+        if fill is None:
+            fill = self._fill = pygame.Surface((int(rect.w), int(rect.h))).convert()
+            fill.fill(self.color)
+        return (
+            fill,
+            (round(x) - camera.offset_x, round(y) - camera.offset_y),
+        )
+
+    def draw(self, surf: pygame.Surface, camera: Camera, alpha: float = 1.0):
+        surf.blit(*self.blit_item(camera, alpha))
@@ -5,6 +5,8 @@ from settings import COLOR_ENEMY
 
 
 class Enemy(Entity):
+    __slots__ = ("base_x", "patrol_range", "speed", "direction")
+
     def __init__(self, pos: tuple[float, float], patrol_range=160, speed=80):
         super().__init__(pos, (24, 28), COLOR_ENEMY)
         self.base_x = pos[0]
@@ -17,6 +19,6 @@ class Enemy(Entity):
         right = self.base_x + self.patrol_range
         if self.rect.x <= left:
             self.direction = 1
-        elif self.rect.x >= right or self.vel.x == 0:
+        elif self.rect.x >= right or self.vx == 0:
             self.direction = -1
-        self.vel.x = self.direction * self.speed
+        self.vx = self.direction * self.speed
@@ -1,9 +1,10 @@
 # player.py
 
+from collections.abc import Container
+
 import pygame
-from pygame import Vector2
 
-from .base import Entity
+from .base import BlitItem, Entity
 from core.animation import (
     Animator,
     slice_grid,
@@ -12,16 +13,11 @@ from core.animation import (
     scale_frames,
 )
 from core.camera import Camera
+from core.physics import next_vx
 from core.utils import asset_path
 from settings import (
-    MAX_SPEED,
-    ACCEL_GROUND,
-    ACCEL_AIR,
-    DECEL_GROUND,
-    DECEL_AIR,
-    FRICTION_GROUND,
-    FRICTION_AIR,
-    JUMP_SPEED,
+    FIXED_DT,
+    NEG_JUMP_SPEED,
     COLOR_PLAYER,
     USE_PLACEHOLDER_GFX,
     JUMP_BUFFER_TIME,
@@ -29,8 +25,26 @@ from settings import (
     DROP_THROUGH_TIME,
 )
 
+# Key codes bound once at import; saves pygame.K_* lookups when reading input
+_K_LEFT, _K_A = pygame.K_LEFT, pygame.K_a
+_K_RIGHT, _K_D = pygame.K_RIGHT, pygame.K_d
+_K_SPACE, _K_UP, _K_W = pygame.K_SPACE, pygame.K_UP, pygame.K_w
+_K_DOWN, _K_S = pygame.K_DOWN, pygame.K_s
+
 
 class Player(Entity):
+    __slots__ = (
+        "facing",
+        "coyote_timer",
+        "jump_buffer_timer",
+        "drop_intent_timer",
+        "suppress_jump_timer",
+        "input_dir",
+        "surface_friction",
+        "anim",
+        "_mirrored",
+    )
+
     def __init__(self, pos: tuple[float, float]):
         super().__init__(pos, (24, 32), COLOR_PLAYER)
         self.facing = 1  # 1=right, -1=left
@@ -38,7 +52,6 @@ class Player(Entity):
         # Timers for input feel
         self.coyote_timer = 0.0  # time left to allow jump after leaving ground
         self.jump_buffer_timer = 0.0  # time left to consume buffered jump input
-        self._prev_jump_down = False  # for detecting edge press
         self.drop_intent_timer = 0.0
         self.suppress_jump_timer = 0.0  # suppress buffered jump after drop-through
 
@@ -51,38 +64,6 @@ class Player(Entity):
         # Load animations (fallback to placeholder if image missing)
         self._load_animations()
 
-    @staticmethod
-    def _sign(x: float) -> int:
-        return (x > 0) - (x < 0)
-
-    def _next_velocity_x(self, vx: float, dt: float, input_dir: int, on_ground: bool):
-        target_vx = input_dir * MAX_SPEED
-        prev_dir = self._sign(vx)
-        need_decel = input_dir != 0 and prev_dir != input_dir and abs(vx) > 1e-5
-
-        # Apply ground/air parameters; ground values are scaled by surface friction.
-        accel = ACCEL_GROUND * self.surface_friction if on_ground else ACCEL_AIR
-        decel = DECEL_GROUND * self.surface_friction if on_ground else DECEL_AIR
-        friction = (
-            FRICTION_GROUND * self.surface_friction if on_ground else FRICTION_AIR
-        )
-
-        next_vel = Vector2(vx, 0)
-        if input_dir != 0:
-            if need_decel:
-                # Kill opposite momentum before accelerating toward the target speed.
-                next_vel.move_towards_ip(Vector2(0.0, 0.0), decel * dt)
-
-            next_vel.move_towards_ip(Vector2(target_vx, 0.0), accel * dt)
-        else:
-            next_vel.move_towards_ip(Vector2(0.0, 0.0), friction * dt)
-
-        assert next_vel.y == 0.0
-        next_vx = next_vel.x
-        next_dir = self._sign(next_vx)
-
-        return next_vx if abs(next_vx) <= MAX_SPEED else MAX_SPEED * next_dir
-
     def _record_drop_intent(self):
         self.drop_intent_timer = DROP_THROUGH_TIME
         # Suppress buffered-jump consumption briefly and clear jump/coyote to avoid accidental jumps.
@@ -95,8 +76,9 @@ class Player(Entity):
     def _record_jump_intent(self):
         self.jump_buffer_timer = JUMP_BUFFER_TIME
 
-    def _tick_timers(self, dt: float):
-        """Decrease input-intent timers each frame."""
+    def _tick_timers(self):
+        """Decrease input-intent timers by one physics step."""
+        dt = FIXED_DT
         if self.jump_buffer_timer > 0:
             self.jump_buffer_timer = max(0.0, self.jump_buffer_timer - dt)
         if self.suppress_jump_timer > 0:
@@ -105,38 +87,48 @@ class Player(Entity):
             self.drop_intent_timer = max(0.0, self.drop_intent_timer - dt)
 
     # --- Input (pre-physics) ---
-    def handle_input(self, dt: float):
-        """Process input: acceleration-based horizontal movement, jump buffering, and drop-through intent."""
-        keys = pygame.key.get_pressed()
+    def handle_key_down(self, key: int, held: Container[int]):
+        """Record jump/drop-through intent on a KEYDOWN event, before `held` adds it.
+
+        A press only counts when no other jump key is already down, matching
+        a single edge per jump.
+        """
+        if key != _K_SPACE and key != _K_UP and key != _K_W:
+            return
+        if _K_SPACE in held or _K_UP in held or _K_W in held:
+            return
+        if _K_DOWN in held or _K_S in held:
+            self._record_drop_intent()
+        else:
+            self._record_jump_intent()
+
+    def handle_input(self, held: Container[int]):
+        """Process input: acceleration-based horizontal movement and intent timers.
 
+        `held` holds the key codes currently down, tracked from KEYDOWN/KEYUP events.
+        Jump and drop-through presses arrive through handle_key_down.
+        """
         # --- Horizontal input handling ---
         self.input_dir = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if _K_LEFT in held or _K_A in held:
             self.input_dir -= 1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if _K_RIGHT in held or _K_D in held:
             self.input_dir += 1
         if self.input_dir:
             self.facing = 1 if self.input_dir > 0 else -1
-        self.vel.x = self._next_velocity_x(
-            self.vel.x, dt, self.input_dir, self.on_ground
+        # Input runs once per fixed physics step; next_vx uses precomputed
+        # per-step deltas, so the timers tick by FIXED_DT as well
+        self.vx = next_vx(
+            self.vx, self.input_dir, self.on_ground, self.surface_friction
         )
 
-        # --- Jump / drop-through input handling ---
-        jump_down = keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w]
-        down_held = keys[pygame.K_DOWN] or keys[pygame.K_s]
-
-        if down_held and jump_down and not self._prev_jump_down:
-            self._record_drop_intent()
-        elif jump_down and not self._prev_jump_down:
-            self._record_jump_intent()
-        self._prev_jump_down = jump_down
-
         # Tick timers
-        self._tick_timers(dt)
+        self._tick_timers()
 
     # --- Post-physics (after collisions) ---
-    def after_physics(self, dt: float):
+    def after_physics(self):
         """Resolve coyote/jump/drop intents after collisions."""
+        dt = FIXED_DT
         # Refresh coyote when grounded; tick down when airborne
         if self.on_ground:
             self.coyote_timer = COYOTE_TIME
@@ -153,8 +145,8 @@ class Player(Entity):
             )
             self.drop_intent_timer = 0.0
             # Nudge downward slightly to ensure separation from the platform.
-            if self.vel.y < 30:
-                self.vel.y = 30
+            if self.vy < 30:
+                self.vy = 30
             return
 
         if self.suppress_jump_timer > 0.0:
@@ -163,7 +155,7 @@ class Player(Entity):
         # If we have a buffered jump and are allowed to jump now, consume it
         can_jump_now = self.on_ground or self.coyote_timer > 0.0
         if self.jump_buffer_timer > 0.0 and can_jump_now:
-            self.vel.y = -JUMP_SPEED
+            self.vy = NEG_JUMP_SPEED
             self.on_ground = False
             self.coyote_timer = 0.0
             self.jump_buffer_timer = 0.0
@@ -172,28 +164,30 @@ class Player(Entity):
     def _state_from_motion(self) -> str:
         # basic 4-state logic: idle/run/jump/fall
         if self.on_ground:
-            return "run" if abs(self.vel.x) > 1e-3 else "idle"
-        return "jump" if self.vel.y < 0 else "fall"
+            return "run" if abs(self.vx) > 1e-3 else "idle"
+        return "jump" if self.vy < 0 else "fall"
 
-    def update_animation(self, dt: float):
+    def update_animation(self):
         state = self._state_from_motion()
         self.anim.set_state(state)
-        self.anim.update(dt)
+        self.anim.update(FIXED_DT)
 
     # --- Drawing ---
-    def draw(self, surf: pygame.Surface, camera: Camera):
-        frame = self.anim.frame()
+    def blit_item(self, camera: Camera, alpha: float = 1.0) -> BlitItem:
+        frame = self.anim.image
         if frame is None:
             # Fallback to colored rect if no frames
-            pygame.draw.rect(surf, self.color, camera.apply(self.rect))
-        else:
-            img = frame
-            if self.facing < 0:
-                img = pygame.transform.flip(img, True, False)
-            dst = camera.apply(self.rect)
-            # Align sprite's bottom-center to the collision box's bottom-center
-            ir = img.get_rect(midbottom=dst.midbottom)
-            surf.blit(img, ir)
+            return super().blit_item(camera, alpha)
+        img = self._mirrored[frame] if self.facing < 0 else frame
+        # Align sprite's bottom-center to the collision box's bottom-center
+        x, y = self.render_pos(alpha)
+        ir = img.get_rect(
+            midbottom=(
+                round(x + self.rect.w / 2) - camera.offset_x,
+                round(y + self.rect.h) - camera.offset_y,
+            )
+        )
+        return img, ir.topleft
 
     # --- Assets ---
     def _load_animations(self):
@@ -249,3 +243,9 @@ class Player(Entity):
             }
         # Build animator
         self.anim = Animator(clips, initial="idle")
+        # Left-facing copies of every frame, flipped once instead of per draw
+        self._mirrored = {
+            f: pygame.transform.flip(f, True, False)
+            for clip in clips.values()
+            for f in clip.frames
+        }
@@ -3,6 +3,7 @@
 import pygame
 
 from core.camera import Camera
+from core.spatial import SpatialHash
 from core.tilemap import TileMap
 from core.tileprops import load_tileset_props
 from core.utils import rects_from_level, asset_path
@@ -14,10 +15,14 @@ from settings import (
     HEIGHT,
     TILE,
     FPS,
-    JUMP_SPEED,
+    FIXED_DT,
+    MAX_FRAME_TIME,
+    STOMP_BOUNCE,
     COLOR_BG,
     COLOR_TILE,
     COLOR_TEXT,
+    HUD_CACHE_SIZE,
+    HUD_FPS_INTERVAL,
 )
 
 
@@ -28,6 +33,10 @@ class Game:
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         self.clock = pygame.Clock()
         self.font = pygame.font.SysFont(None, 18)
+        # HUD text surfaces keyed by string, in least-recently-used order
+        self._hud_cache: dict[str, pygame.Surface] = {}
+        self._hud_frame = 0
+        self._hud_fps = 0.0
 
         # Try to load CSV tilemap; if missing, fall back to LEVEL string map
         csv_map = asset_path("maps", "level1.csv")
@@ -42,6 +51,8 @@ class Game:
             world_w, world_h = self.tilemap.world_size
             # Build solids (treat all non-negative indices as solid by default)
             self.solid_tiles = self.tilemap.solid_rects()
+            # Entities query nearby merged solids instead of scanning all
+            self.solid_query = self.tilemap.query_solids
             self.one_way_tiles = self.tilemap.one_way_rects()
             self.deadly_tiles = self.tilemap.deadly_rects()
             self.spawns = self.tilemap.spawn_points()
@@ -49,113 +60,202 @@ class Game:
             # Fallback: use built-in LEVEL string map
             self.tilemap = None
             self.solid_tiles = rects_from_level(LEVEL)
+            self.solid_query = SpatialHash(self.solid_tiles).query
             self.one_way_tiles = []
             self.deadly_tiles = []
             self.spawns = []
             world_w = len(LEVEL[0]) * TILE
             world_h = len(LEVEL) * TILE
+            # The LEVEL map is static: draw it once, blit one surface per frame
+            self.world_bg = pygame.Surface((world_w, world_h)).convert()
+            self.world_bg.fill(COLOR_BG)
+            for t in self.solid_tiles:
+                pygame.draw.rect(self.world_bg, COLOR_TILE, t)
 
         # Entities
         self.player = Player((TILE * 3, TILE * 2))
         if self.spawns:
             self.player.rect.center = self.spawns[0]
+        self.player.save_position()
         self.enemies = [Enemy((TILE * 14, TILE * 8), patrol_range=96)]
 
-        # Camera
+        # Camera, and the interpolated player box it follows (reused per frame)
         self.camera = Camera(world_w, world_h)
+        self._follow_rect = self.player.rect.copy()
+
+        # Key codes currently held, maintained from KEYDOWN/KEYUP events
+        self.held: set[int] = set()
 
         self.running = True
 
-    def run(self):
-        while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+    def _render_cached(self, text: str) -> pygame.Surface:
+        """Render HUD text, reusing the surface for recently seen strings."""
+        surf = self._hud_cache.pop(text, None)
+        if surf is None:
+            surf = self.font.render(text, True, COLOR_TEXT)
+            if len(self._hud_cache) >= HUD_CACHE_SIZE:
+                del self._hud_cache[next(iter(self._hud_cache))]
+        self._hud_cache[text] = surf  # (re)insert as most recent
+        return surf
 
-            # --- Events ---
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-
-            # --- Input & AI (pre-physics) ---
-            self.player.handle_input(dt)
-            for en in self.enemies:
-                en.update_ai()
+    def _step(self):
+        """Advance the simulation by one fixed timestep (FIXED_DT)."""
+        player = self.player
+        p_rect = player.rect
+        solid_query, one_ways = self.solid_query, self.one_way_tiles
+        player.save_position()
+        for en in self.enemies:
+            en.save_position()
 
-            # --- Physics & Collision ---
-            self.player.move_and_collide(dt, self.solid_tiles, self.one_way_tiles)
-            for en in self.enemies:
-                en.move_and_collide(dt, self.solid_tiles, self.one_way_tiles)
+        # --- Input (pre-physics) ---
+        player.handle_input(self.held)
 
-            # --- Post-physics (coyote + jump buffer resolution) ---
-            self.player.after_physics(dt)
+        # --- Physics & Collision ---
+        player.move_and_collide(solid_query, one_ways)
+        # Enemies never read player state here, so AI and physics share one pass
+        for en in self.enemies:
+            en.update_ai()
+            en.move_and_collide(solid_query, one_ways)
 
-            # --- Deadly tile check ---
-            if self.player.rect.collidelist(self.deadly_tiles) != -1:
-                if self.spawns:
-                    self.player.rect.center = self.spawns[0]
-                else:
-                    self.player.rect.topleft = (TILE * 3, TILE * 2)
-                self.player.vel.update(0, 0)
+        # --- Post-physics (coyote + jump buffer resolution) ---
+        player.after_physics()
 
-            # --- Update surface friction for the next frame ---
-            if self.tilemap and self.player.on_ground:
-                self.player.surface_friction = self.tilemap.friction_under(
-                    self.player.rect
-                )
+        # --- Deadly tile check ---
+        if p_rect.collidelist(self.deadly_tiles) != -1:
+            if self.spawns:
+                p_rect.center = self.spawns[0]
             else:
-                self.player.surface_friction = 1.0
-
-            # --- Player-Enemy interaction ---
-            for en in self.enemies[:]:
-                if self.player.rect.colliderect(en.rect):
-                    # Stomp check: player falling and above enemy center
-                    if (
-                        self.player.vel.y > 0
-                        and self.player.rect.bottom <= en.rect.centery
-                    ):
-                        self.player.vel.y = -JUMP_SPEED * 0.55
-                        self.enemies.remove(en)
+                p_rect.topleft = (TILE * 3, TILE * 2)
+            player.vx = player.vy = 0.0
+            player.save_position()  # don't interpolate across the respawn
+
+        # --- Update surface friction for the next frame ---
+        if self.tilemap and player.on_ground:
+            player.surface_friction = self.tilemap.friction_under(p_rect)
+        else:
+            player.surface_friction = 1.0
+
+        # --- Player-Enemy interaction ---
+        # Resolve in list order; stomped enemies are removed afterwards so
+        # the loop needs no list copy
+        enemies = self.enemies
+        stomped = None
+        for i, en in enumerate(enemies):
+            if p_rect.colliderect(en.rect):
+                # Stomp check: player falling and above enemy center
+                if player.vy > 0 and p_rect.bottom <= en.rect.centery:
+                    player.vy = STOMP_BOUNCE
+                    if stomped is None:
+                        stomped = []
+                    stomped.append(i)
+                else:
+                    # Simple respawn
+                    if self.spawns:
+                        p_rect.center = self.spawns[0]
                     else:
-                        # Simple respawn
-                        if self.spawns:
-                            self.player.rect.center = self.spawns[0]
-                        else:
-                            self.player.rect.topleft = (TILE * 3, TILE * 2)
-                        self.player.vel.update(0, 0)
+                        p_rect.topleft = (TILE * 3, TILE * 2)
+                    player.vx = player.vy = 0.0
+                    player.save_position()
+        if stomped:
+            # Swap-remove from the highest index down: each slot is refilled
+            # with a survivor, in O(1) per removal
+            for i in reversed(stomped):
+                enemies[i] = enemies[-1]
+                enemies.pop()
 
-            # --- Camera ---
-            self.camera.follow(self.player.rect)
+        # --- Animation update ---
+        player.update_animation()
 
-            # --- Animation update ---
-            self.player.update_animation(dt)
+    def run(self):
+        # Loop-invariant lookups bound once as locals
+        player = self.player
+        enemies = self.enemies
+        camera = self.camera
+        follow_rect = self._follow_rect
+        view = camera.rect
+        screen = self.screen
+        tilemap = self.tilemap
+        held = self.held
+        tick = self.clock.tick
+        event_get = pygame.event.get
+        flip = pygame.display.flip
+        render_cached = self._render_cached
+        step = self._step
+        QUIT, KEYDOWN, KEYUP = pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP
+        WINDOWFOCUSLOST = pygame.WINDOWFOCUSLOST
+
+        # Unsimulated real time; physics always advances in FIXED_DT steps
+        acc = 0.0
+        while self.running:
+            # Clamp stalls (window drag, breakpoints) to avoid a catch-up spiral
+            acc += min(tick(FPS) / 1000.0, MAX_FRAME_TIME)
+
+            # --- Events ---
+            for event in event_get():
+                etype = event.type
+                if etype == QUIT:
+                    self.running = False
+                elif etype == KEYDOWN:
+                    player.handle_key_down(event.key, held)
+                    held.add(event.key)
+                elif etype == KEYUP:
+                    held.discard(event.key)
+                elif etype == WINDOWFOCUSLOST:
+                    # Key releases may never arrive once focus is gone
+                    held.clear()
+
+            # --- Fixed-step simulation ---
+            while acc >= FIXED_DT:
+                step()
+                acc -= FIXED_DT
+
+            # --- Camera ---
+            # Render between the last two physics states: a 16/17 ms tick
+            # runs 0, 1 or 2 steps per frame, which would otherwise judder
+            alpha = acc / FIXED_DT
+            p_rect = player.rect
+            follow_rect.topleft = player.render_pos(alpha)
+            camera.follow(follow_rect)
 
             # --- Render ---
-            self.screen.fill(COLOR_BG)
+            screen.fill(COLOR_BG)
 
-            if self.tilemap:
-                self.tilemap.draw(self.screen, self.camera)
+            if tilemap:
+                tilemap.draw(screen, camera)
             else:
-                for t in self.solid_tiles:
-                    pygame.draw.rect(self.screen, COLOR_TILE, self.camera.apply(t))
-
-            self.player.draw(self.screen, self.camera)
-            # self.player.debug_draw(self.screen, self.camera)
-            for en in self.enemies:
-                en.draw(self.screen, self.camera)
-
-            # HUD
-            fps_text = self.font.render(
-                f"FPS {self.clock.get_fps():.0f}  pos=({self.player.rect.x:.1f},{self.player.rect.y:.1f})",
-                True,
-                COLOR_TEXT,
-            )
-            # in Game.run() render section
-            dbg = self.font.render(
-                f"fric={self.player.surface_friction:.2f}", True, COLOR_TEXT
+                # Copy only the part of the pre-rendered world under the view;
+                # a view larger than the world (negative offset) starts inset
+                ox, oy = camera.offset_x, camera.offset_y
+                screen.blit(
+                    self.world_bg,
+                    (max(0, -ox), max(0, -oy)),
+                    (max(0, ox), max(0, oy), WIDTH, HEIGHT),
+                )
+
+            # Sprites and HUD go to SDL as one batch, in back-to-front order
+            draws = [player.blit_item(camera, alpha)]
+            # player.debug_draw(screen, camera)
+            draws += [
+                en.blit_item(camera, alpha)
+                for en in enemies
+                if view.colliderect(en.rect)
+            ]
+
+            # HUD: FPS is sampled every few frames and the position shown in
+            # whole pixels so the strings repeat and hit the render cache
+            self._hud_frame += 1
+            if self._hud_frame >= HUD_FPS_INTERVAL:
+                self._hud_frame = 0
+                self._hud_fps = self.clock.get_fps()
+            fps_text = render_cached(
+                f"FPS {self._hud_fps:.0f}  pos=({p_rect.x:.0f},{p_rect.y:.0f})"
             )
-            self.screen.blit(fps_text, (8, 8))
-            self.screen.blit(dbg, (8, 24))
+            dbg = render_cached(f"fric={player.surface_friction:.2f}")
+            draws.append((fps_text, (8, 8)))
+            draws.append((dbg, (8, 24)))
+            screen.blits(draws, doreturn=False)
 
-            pygame.display.flip()
+            flip()
 
         pygame.quit()
 
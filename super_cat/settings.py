@@ -4,9 +4,13 @@
 WIDTH, HEIGHT = 960, 540
 TILE = 32
 FPS = 60
+FIXED_DT = 1 / FPS  # physics timestep (s), independent of render rate
+MAX_FRAME_TIME = 0.25  # longest real frame (s) fed into the simulation
 
 # Vertical physics
 JUMP_SPEED = 640  # px/s
+NEG_JUMP_SPEED = -JUMP_SPEED  # upward launch velocity (px/s)
+STOMP_BOUNCE = -JUMP_SPEED * 0.55  # upward velocity after stomping an enemy
 GRAVITY = 1800
 TERMINAL_V = 1400
 
@@ -32,6 +36,10 @@ COLOR_PLAYER = (40, 160, 255)
 COLOR_ENEMY = (220, 60, 60)
 COLOR_TEXT = (230, 230, 230)
 
+# HUD
+HUD_CACHE_SIZE = 16  # rendered text surfaces kept for reuse
+HUD_FPS_INTERVAL = 10  # frames between FPS readout refreshes
+
 # Animation
 ANIM_DEFAULT_FPS = 10
 USE_PLACEHOLDER_GFX = False